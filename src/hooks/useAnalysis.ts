@@ -1 +1,30 @@
 // useAnalysis Hook - 分析功能 Hook
+import { useCallback, useState } from 'react';
+import type { AnalysisReport, AnalysisResult, ConflictReport, DependencyNode, RedundancyReport } from '../types';
+import { analyzeDependencies as runAnalysis } from '../utils/algorithms';
+
+/**
+ * 分析只在 analyzeDependencies 中执行一次；冗余与冲突报告从已有结果读取，
+ * 不会重复遍历依赖树。
+ */
+export default function useAnalysis() {
+  const [analysisResult, setAnalysisResult] = useState<AnalysisResult | null>(null);
+
+  const analyzeDependencies = useCallback((tree: DependencyNode, report: AnalysisReport): AnalysisResult => {
+    const result = runAnalysis(tree, report);
+    setAnalysisResult(result);
+    return result;
+  }, []);
+
+  const findRedundantDeps = useCallback(
+    (result: AnalysisResult): RedundancyReport[] => result.redundantDeps,
+    [],
+  );
+
+  const detectConflicts = useCallback(
+    (result: AnalysisResult): ConflictReport[] => result.conflicts ?? [],
+    [],
+  );
+
+  return { analyzeDependencies, findRedundantDeps, detectConflicts, analysisResult };
+}
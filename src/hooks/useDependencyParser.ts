@@ -1 +1,88 @@
 // useDependencyParser Hook - 依赖解析 Hook
+import { useCallback, useState } from 'react';
+import type { AnalysisReport, DependencyNode } from '../types';
+import { readFileText } from '../utils/helpers';
+import { parseAnalysisReportStream, parseDependencyTree } from '../utils/parser';
+
+// 构建日志先按 UTF-8 严格解码；遇到非法字节时（中文 Windows 控制台保存的日志常为 GBK）
+// 重新读取文件改用 GBK 解码。纯 ASCII 的日志不会触发重读
+function parseReportFile(file: Blob): Promise<AnalysisReport> {
+  return parseAnalysisReportStream(file.stream(), 'utf-8', true).catch((error: unknown) => {
+    if (!(error instanceof TypeError)) {
+      throw error;
+    }
+    return parseAnalysisReportStream(file.stream(), 'gbk');
+  });
+}
+
+// 以 文件名 + 大小 + 修改时间 缓存 TXT 解析结果（最近使用的若干个），重复选择同一文件时直接复用。
+// 浏览器不提供文件路径，两个同名、同大小且修改时间相同的不同日志会命中同一条缓存；
+// 若为避免碰撞而读取内容计算摘要，缓存就失去了意义。
+// 每次都返回副本，调用方就地修改报告不会影响之后命中的结果。
+// 依赖树不缓存：分析时会在节点上写入状态，复用会残留上一次的标记
+const REPORT_CACHE_LIMIT = 16;
+const reportCache = new Map<string, Promise<AnalysisReport>>();
+
+function parseReportCached(file: File): Promise<AnalysisReport> {
+  const key = `${file.name}:${file.size}:${file.lastModified}`;
+  let parsing = reportCache.get(key);
+  if (parsing) {
+    // 重新插入以刷新最近使用顺序
+    reportCache.delete(key);
+    reportCache.set(key, parsing);
+  } else {
+    parsing = parseReportFile(file);
+    parsing.catch(() => reportCache.delete(key));
+    reportCache.set(key, parsing);
+    if (reportCache.size > REPORT_CACHE_LIMIT) {
+      reportCache.delete(reportCache.keys().next().value!);
+    }
+  }
+  return parsing.then((report) => structuredClone(report));
+}
+
+/**
+ * 解析上传的依赖树 JSON 与依赖分析 TXT 文件。
+ * TXT 通过 File.stream() 流式解析，大型构建日志不会被整体读入内存。
+ */
+export default function useDependencyParser() {
+  const [pendingCount, setPendingCount] = useState(0);
+  const [error, setError] = useState<string | null>(null);
+
+  const track = useCallback(async <T>(task: () => Promise<T>): Promise<T> => {
+    setPendingCount((count) => count + 1);
+    setError(null);
+    try {
+      return await task();
+    } catch (err) {
+      setError((err as Error).message);
+      throw err;
+    } finally {
+      setPendingCount((count) => count - 1);
+    }
+  }, []);
+
+  const parseJsonFile = useCallback(
+    (file: File): Promise<DependencyNode> => track(() => readFileText(file).then(parseDependencyTree)),
+    [track],
+  );
+
+  const parseTxtFile = useCallback(
+    (file: File): Promise<AnalysisReport> => track(() => parseReportCached(file)),
+    [track],
+  );
+
+  // 两个文件的读取互不依赖，同时发起，总耗时取决于较慢的一个
+  const parseFiles = useCallback(
+    (jsonFile: File, txtFile: File): Promise<[DependencyNode, AnalysisReport]> =>
+      track(() =>
+        Promise.all([
+          readFileText(jsonFile).then(parseDependencyTree),
+          parseReportCached(txtFile),
+        ]),
+      ),
+    [track],
+  );
+
+  return { parseJsonFile, parseTxtFile, parseFiles, isLoading: pendingCount > 0, error };
+}
@@ -1 +1,104 @@
 // TypeScript 类型定义
+
+/** tree-mojo 输出的原始依赖节点（optional 可能是布尔值或 "true"/"false" 字符串） */
+export interface RawDependencyNode {
+  groupId?: string;
+  artifactId?: string;
+  version?: string;
+  type?: string;
+  scope?: string;
+  classifier?: string;
+  optional?: boolean | string;
+  children?: RawDependencyNode[];
+}
+
+/** 解析后的 Maven 坐标，缺失的部分为空字符串 */
+export interface MavenCoordinate {
+  groupId: string;
+  artifactId: string;
+  type: string;
+  classifier: string;
+  version: string;
+  scope: string;
+}
+
+/** 依赖节点 */
+export interface DependencyNode {
+  id: string;            // 唯一标识符，格式为groupId:artifactId
+  groupId: string;
+  artifactId: string;
+  version: string;
+  type: string;
+  scope: string;
+  classifier: string;
+  optional: boolean;
+  children: DependencyNode[];
+  expanded?: boolean;    // UI状态：是否展开
+  selected?: boolean;    // UI状态：是否选中
+  usageStatus?: 'used' | 'unused' | 'undeclared'; // 分析状态
+  isRedundant?: boolean; // 是否为冗余依赖
+}
+
+/** mvn dependency:analyze 输出的解析结果 */
+export interface AnalysisReport {
+  projectCoordinate?: string;    // 日志中首个构建项目的 groupId:artifactId
+  usedUndeclaredDeps: string[];  // 未声明但使用的依赖（projectCoordinate 模块；日志无项目标题时为全部）
+  unusedDeclaredDeps: string[];  // 已声明但未使用的依赖（同上）
+  modules?: Record<string, AnalysisReport>; // 多模块构建中各模块的结果，键为模块的 groupId:artifactId
+}
+
+export interface RedundancyReport {
+  dependency: string; // 冗余依赖坐标
+  reason: string;     // 冗余原因
+  alternatives: string[]; // 替代建议
+}
+
+export interface ConflictReport {
+  dependency: string; // 冲突依赖坐标
+  versions: string[]; // 不同版本
+  locations: string[]; // 出现位置
+}
+
+/** 依赖树单次遍历的汇总结果，供分析算法与视图共享 */
+export interface TreeScan {
+  index: Map<string, DependencyNode[]>;          // groupId:artifactId -> 节点（先序）
+  parents: Map<DependencyNode, DependencyNode>;  // 子节点 -> 父节点
+  depthHistogram: number[];                      // 下标为深度（根为 0），值为节点数
+  scopeCounts: Map<string, number>;              // scope -> 依赖数（不含根，空 scope 计为 compile）
+  typeCounts: Map<string, number>;               // type -> 依赖数（不含根）
+  totalDependencies: number;                     // 不含根节点的依赖总数
+}
+
+/** 依赖树统计信息 */
+export interface DependencyStatistics {
+  totalDependencies: number;  // 不含根节点的依赖总数
+  directDependencies: number; // 直接依赖数
+  uniqueArtifacts: number;    // 不同 groupId:artifactId 的数量
+  maxDepth: number;           // 最大深度（直接依赖为 1）
+  depthDistribution: number[]; // 下标 i 为深度 i + 1 的依赖数
+  scopeDistribution: Record<string, number>; // scope -> 依赖数
+  typeDistribution: Record<string, number>;  // type -> 依赖数
+}
+
+/** 直接依赖引入的传递依赖数量 */
+export interface TransitiveDependencyStat {
+  dependency: DependencyNode;
+  transitiveCount: number;
+}
+
+/** 依赖树过滤选项 */
+export interface TreeFilterOptions {
+  scope?: string;    // 只保留该 scope 的依赖（及通往它们的祖先）
+  maxDepth?: number; // 最大展示深度（直接依赖为 1）
+}
+
+/** 分析结果 */
+export interface AnalysisResult {
+  dependencyTree: DependencyNode;
+  treeScan: TreeScan; // 单次遍历结果，供视图复用
+  statistics: DependencyStatistics; // 由 treeScan 推导的统计信息
+  usedUndeclaredDeps: string[];  // 未声明但使用的依赖
+  unusedDeclaredDeps: string[];  // 已声明但未使用的依赖
+  redundantDeps: RedundancyReport[]; // 冗余依赖报告
+  conflicts?: ConflictReport[];   // 冲突报告
+}
@@ -1 +1,379 @@
 // algorithms.ts - 核心算法
+import type {
+  AnalysisReport,
+  AnalysisResult,
+  ConflictReport,
+  DependencyNode,
+  DependencyStatistics,
+  RedundancyReport,
+  TransitiveDependencyStat,
+  TreeFilterOptions,
+  TreeScan,
+} from '../types';
+import { parseCoordinate, toDependencyId } from './helpers';
+
+const REDUNDANCY_REASON = '已声明但未使用，仅通过它间接使用了传递依赖';
+
+/** 迭代深度优先遍历的栈帧：next 为下一个待访问子节点的下标 */
+interface TraversalFrame<T> {
+  node: DependencyNode;
+  next: number;
+  state: T;
+}
+
+/**
+ * 依赖关系映射：关联依赖树与分析结果，生成完整的分析结果。
+ *
+ * 依赖树只扫描一次，索引、父节点映射等随结果返回，标记节点状态、
+ * 冲突检测、统计信息和后续视图查询都复用它；各项报告也只计算一次。
+ */
+export function analyzeDependencies(tree: DependencyNode, analysisReport: AnalysisReport): AnalysisResult {
+  // 多模块构建的日志按依赖树根节点选取对应模块，避免用其他模块的结果标记这棵树
+  const report = analysisReport.modules?.[tree.id] ?? analysisReport;
+  const treeScan = scanDependencyTree(tree);
+  const redundantDeps = findRedundantDeps(tree, report);
+  markDependencyStatus(tree, treeScan, report, redundantDeps);
+
+  return {
+    dependencyTree: tree,
+    treeScan,
+    statistics: getStatistics(tree, treeScan),
+    // 复制一份：解析结果可能被缓存复用，视图对结果的就地排序等不能影响报告本身
+    usedUndeclaredDeps: [...report.usedUndeclaredDeps],
+    unusedDeclaredDeps: [...report.unusedDeclaredDeps],
+    redundantDeps,
+    conflicts: detectConflicts(treeScan),
+  };
+}
+
+/**
+ * 一次先序遍历同时得到：groupId:artifactId -> 节点列表 的索引（同一依赖可能
+ * 经由不同路径出现多次）、父节点映射、各深度 / scope / type 的节点数与依赖总数，
+ * 避免索引、冲突检测和各项统计各自再遍历一遍依赖树。
+ * 结果不做缓存，调用方应把同一次扫描结果传给各个需要它的函数。
+ */
+export function scanDependencyTree(tree: DependencyNode): TreeScan {
+  const index = new Map<string, DependencyNode[]>();
+  const parents = new Map<DependencyNode, DependencyNode>();
+  const depthHistogram: number[] = [];
+  const scopeCounts = new Map<string, number>();
+  const typeCounts = new Map<string, number>();
+  const nodes: DependencyNode[] = [tree];
+  const depths: number[] = [0];
+
+  while (nodes.length > 0) {
+    const node = nodes.pop()!;
+    const depth = depths.pop()!;
+
+    const sameId = index.get(node.id);
+    if (sameId) {
+      sameId.push(node);
+    } else {
+      index.set(node.id, [node]);
+    }
+    depthHistogram[depth] = (depthHistogram[depth] ?? 0) + 1;
+
+    for (let i = node.children.length - 1; i >= 0; i--) {
+      const child = node.children[i];
+      parents.set(child, node);
+      increment(scopeCounts, child.scope || 'compile');
+      increment(typeCounts, child.type);
+      nodes.push(child);
+      depths.push(depth + 1);
+    }
+  }
+
+  return { index, parents, depthHistogram, scopeCounts, typeCounts, totalDependencies: parents.size };
+}
+
+/**
+ * 将分析结果回写到依赖树节点上（usageStatus / isRedundant）。
+ *
+ * 先清除所有节点上的旧标记，同一棵树换用新的报告重新分析时不会残留；
+ * dependency:analyze 只报告声明的依赖和未声明使用的依赖，因此只有不在
+ * 未使用列表中的直接依赖标记为 used，报告未提及的传递依赖保持未标记。
+ * 每个坐标通过索引直接定位节点，不再逐个搜索整棵树。
+ */
+export function markDependencyStatus(
+  tree: DependencyNode,
+  treeScan: TreeScan,
+  report: AnalysisReport,
+  redundantDeps: RedundancyReport[],
+): void {
+  for (const nodes of treeScan.index.values()) {
+    for (const node of nodes) {
+      node.usageStatus = undefined;
+      node.isRedundant = undefined;
+    }
+  }
+  // 未使用的直接依赖随后会被覆盖为 unused
+  for (const node of tree.children) {
+    node.usageStatus = 'used';
+  }
+  for (const coordinate of report.usedUndeclaredDeps) {
+    for (const node of findDependencies(treeScan, coordinate)) {
+      node.usageStatus = 'undeclared';
+    }
+  }
+  for (const coordinate of report.unusedDeclaredDeps) {
+    for (const node of findDependencies(treeScan, coordinate)) {
+      node.usageStatus = 'unused';
+    }
+  }
+  for (const { dependency } of redundantDeps) {
+    for (const node of findDependencies(treeScan, dependency)) {
+      node.isRedundant = true;
+    }
+  }
+}
+
+/** 通过扫描结果的索引查找坐标（或 groupId:artifactId）对应的所有节点，不遍历依赖树 */
+export function findDependencies(treeScan: TreeScan, coordinate: string): readonly DependencyNode[] {
+  return treeScan.index.get(toDependencyId(coordinate)) ?? [];
+}
+
+/**
+ * 冗余依赖检测：已声明但未使用的依赖 A，如果它的传递依赖 B 被使用却未声明，
+ * 应直接声明 B，而不是引入 A 去使用 B。
+ *
+ * 两类坐标都预先建成 id -> 坐标 的 Map。整棵树只做一次深度优先遍历：
+ * 进入已声明未使用的节点时入栈，命中未声明使用的节点时归到栈中所有祖先，
+ * 不再为每个未使用依赖单独查找节点、再单独遍历其子树。
+ */
+export function findRedundantDeps(tree: DependencyNode, report: AnalysisReport): RedundancyReport[] {
+  // 构建通过的项目通常没有未声明使用的依赖，此时不可能存在冗余，无需遍历
+  if (report.usedUndeclaredDeps.length === 0 || report.unusedDeclaredDeps.length === 0) {
+    return [];
+  }
+
+  const usedUndeclared = toCoordinateMap(report.usedUndeclaredDeps);
+  const unusedDeclared = toCoordinateMap(report.unusedDeclaredDeps);
+  // 以声明坐标为键合并：同一依赖出现在多处时只产生一条报告，替代建议自动去重
+  const alternativesByDependency = new Map<string, Set<string>>();
+  const openAlternatives: Set<string>[] = [];
+
+  const enter = (node: DependencyNode): boolean => {
+    const used = usedUndeclared.get(node.id);
+    if (used !== undefined) {
+      for (const alternatives of openAlternatives) {
+        alternatives.add(used);
+      }
+    }
+
+    const declared = unusedDeclared.get(node.id);
+    if (declared === undefined) {
+      return false;
+    }
+    let alternatives = alternativesByDependency.get(declared);
+    if (alternatives === undefined) {
+      alternatives = new Set();
+      alternativesByDependency.set(declared, alternatives);
+    }
+    openAlternatives.push(alternatives);
+    return true;
+  };
+
+  // 显式栈模拟先序进入/后序退出，深层依赖树不会受调用栈深度限制
+  const frames: TraversalFrame<boolean>[] = [{ node: tree, next: 0, state: enter(tree) }];
+  while (frames.length > 0) {
+    const frame = frames[frames.length - 1];
+    if (frame.next < frame.node.children.length) {
+      const child = frame.node.children[frame.next++];
+      frames.push({ node: child, next: 0, state: enter(child) });
+      continue;
+    }
+
+    frames.pop();
+    if (frame.state) {
+      openAlternatives.pop();
+    }
+  }
+
+  const redundant: RedundancyReport[] = [];
+  for (const [dependency, alternatives] of alternativesByDependency) {
+    if (alternatives.size > 0) {
+      redundant.push({ dependency, reason: REDUNDANCY_REASON, alternatives: [...alternatives].sort() });
+    }
+  }
+  // 替代建议越多越值得优先处理；直接按数组长度比较，同数量时按坐标排序保证顺序稳定
+  return redundant.sort((a, b) => (
+    b.alternatives.length - a.alternatives.length
+    || (a.dependency < b.dependency ? -1 : a.dependency > b.dependency ? 1 : 0)
+  ));
+}
+
+/**
+ * 版本冲突检测：同一 groupId:artifactId 在树中出现了多个版本。
+ *
+ * 直接复用扫描结果中按 id 分组的索引，只检查出现多次的分组，
+ * 出现位置取父节点坐标。
+ */
+export function detectConflicts(treeScan: TreeScan): ConflictReport[] {
+  const conflicts: ConflictReport[] = [];
+  for (const [dependency, nodes] of treeScan.index) {
+    // 多次出现的依赖大多版本一致，先线性比较，确有冲突时才构建版本集合
+    const firstVersion = nodes[0].version;
+    if (nodes.every((node) => node.version === firstVersion)) {
+      continue;
+    }
+    conflicts.push({
+      dependency,
+      versions: [...new Set(nodes.map((node) => node.version))],
+      locations: nodes.map((node) => {
+        const parent = treeScan.parents.get(node);
+        return parent ? `${parent.id}:${parent.version}` : '';
+      }),
+    });
+  }
+  return conflicts;
+}
+
+/**
+ * 查找从根节点到目标依赖的所有路径，target 可以是完整坐标或 groupId:artifactId；
+ * 坐标带版本时只匹配该版本的节点。
+ *
+ * 通过扫描结果的索引直接定位目标节点，再沿父节点映射向上回溯到根，
+ * 每条路径的代价只与其深度相关，不需要遍历整棵树。
+ */
+export function getDependencyPaths(
+  tree: DependencyNode,
+  target: string,
+  treeScan: TreeScan = scanDependencyTree(tree),
+): DependencyNode[][] {
+  const { groupId, artifactId, version } = parseCoordinate(target);
+  const paths: DependencyNode[][] = [];
+
+  for (const node of treeScan.index.get(`${groupId}:${artifactId}`) ?? []) {
+    if (version !== '' && node.version !== version) {
+      continue;
+    }
+    const path: DependencyNode[] = [];
+    for (let current: DependencyNode | undefined = node; current; current = treeScan.parents.get(current)) {
+      path.push(current);
+    }
+    paths.push(path.reverse());
+  }
+  return paths;
+}
+
+/**
+ * 依赖树统计信息。
+ *
+ * 全部由 scanDependencyTree 的结果推导；调用方已有扫描结果时应传入复用，
+ * 避免为统计再遍历一遍依赖树。
+ */
+export function getStatistics(
+  tree: DependencyNode,
+  treeScan: TreeScan = scanDependencyTree(tree),
+): DependencyStatistics {
+  const { depthHistogram, index, totalDependencies } = treeScan;
+  return {
+    totalDependencies,
+    directDependencies: tree.children.length,
+    // 根节点自身也计入了索引
+    uniqueArtifacts: index.get(tree.id)?.length === 1 ? index.size - 1 : index.size,
+    maxDepth: depthHistogram.length - 1,
+    depthDistribution: depthHistogram.slice(1),
+    scopeDistribution: Object.fromEntries(treeScan.scopeCounts),
+    typeDistribution: Object.fromEntries(treeScan.typeCounts),
+  };
+}
+
+/**
+ * 计算每个节点的子孙数量。
+ *
+ * 节点总数取自扫描结果，先序序列、父节点序号与计数都按此预先分配（后两者为
+ * Int32Array），遍历时直接按序号写入；再逆序把计数累加到父节点：子节点总在
+ * 父节点之后出现，因此一次逆序扫描即可完成，累加过程不做 Map 查找。
+ * 调用方已有扫描结果时应传入复用。
+ */
+export function countDescendants(
+  tree: DependencyNode,
+  treeScan: TreeScan = scanDependencyTree(tree),
+): Map<DependencyNode, number> {
+  const size = treeScan.totalDependencies + 1;
+  const order = new Array<DependencyNode>(size);
+  const parents = new Int32Array(size);
+  const stack: DependencyNode[] = [tree];
+  const stackParents: number[] = [-1];
+  for (let position = 0; stack.length > 0; position++) {
+    const node = stack.pop()!;
+    order[position] = node;
+    parents[position] = stackParents.pop()!;
+    for (const child of node.children) {
+      stack.push(child);
+      stackParents.push(position);
+    }
+  }
+
+  const counts = new Int32Array(size);
+  for (let i = size - 1; i > 0; i--) {
+    counts[parents[i]] += counts[i] + 1;
+  }
+
+  const result = new Map<DependencyNode, number>();
+  for (let i = 0; i < size; i++) {
+    result.set(order[i], counts[i]);
+  }
+  return result;
+}
+
+/** 引入传递依赖最多的前 limit 个直接依赖 */
+export function findMostTransitiveDeps(
+  tree: DependencyNode,
+  limit = 10,
+  descendantCounts: Map<DependencyNode, number> = countDescendants(tree),
+): TransitiveDependencyStat[] {
+  return tree.children
+    .map((dependency) => ({ dependency, transitiveCount: descendantCounts.get(dependency)! }))
+    .sort((a, b) => b.transitiveCount - a.transitiveCount)
+    .slice(0, limit);
+}
+
+/**
+ * 按 scope / 最大深度裁剪依赖树，返回新的树（根节点始终保留，原树不变）。
+ *
+ * 在同一次遍历中完成过滤：超出最大深度的子树不会被访问；后序构建时只复制
+ * 自身匹配或含有匹配子孙的节点，不为被过滤的节点生成中间对象。
+ * 传入扫描结果时，若树中根本没有该 scope 的依赖则直接返回空树，不再遍历。
+ */
+export function filterDependencyTree(
+  tree: DependencyNode,
+  { scope, maxDepth }: TreeFilterOptions,
+  treeScan?: TreeScan,
+): DependencyNode {
+  if (scope && treeScan && !treeScan.scopeCounts.has(scope)) {
+    return { ...tree, children: [] };
+  }
+
+  const frames: TraversalFrame<{ depth: number; kept: DependencyNode[] }>[] = [
+    { node: tree, next: 0, state: { depth: 0, kept: [] } },
+  ];
+
+  for (;;) {
+    const frame = frames[frames.length - 1];
+    const { depth, kept } = frame.state;
+    if (frame.next < frame.node.children.length && (maxDepth === undefined || depth < maxDepth)) {
+      const child = frame.node.children[frame.next++];
+      frames.push({ node: child, next: 0, state: { depth: depth + 1, kept: [] } });
+      continue;
+    }
+
+    frames.pop();
+    const copy = { ...frame.node, children: kept };
+    if (frames.length === 0) {
+      return copy;
+    }
+    if (!scope || (frame.node.scope || 'compile') === scope || kept.length > 0) {
+      frames[frames.length - 1].state.kept.push(copy);
+    }
+  }
+}
+
+function toCoordinateMap(coordinates: string[]): Map<string, string> {
+  return new Map(coordinates.map((coordinate) => [toDependencyId(coordinate), coordinate]));
+}
+
+function increment(counts: Map<string, number>, key: string): void {
+  counts.set(key, (counts.get(key) ?? 0) + 1);
+}
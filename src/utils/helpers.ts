@@ -1 +1,53 @@
 // helpers.ts - 辅助函数
+import type { MavenCoordinate } from '../types';
+
+/**
+ * 从 Maven 坐标（groupId:artifactId[:type]:version[:scope]）中取出
+ * 与 DependencyNode.id 一致的 groupId:artifactId。
+ */
+export function toDependencyId(coordinate: string): string {
+  const first = coordinate.indexOf(':');
+  if (first < 0) {
+    return coordinate;
+  }
+  const second = coordinate.indexOf(':', first + 1);
+  return second < 0 ? coordinate : coordinate.slice(0, second);
+}
+
+/**
+ * 解析 Maven 坐标，只切分一次再按段数取值：
+ * groupId:artifactId[:type[:classifier]]:version[:scope]
+ * （与 dependency:analyze 输出一致；4 段时视为 groupId:artifactId:type:version）
+ */
+export function parseCoordinate(coordinate: string): MavenCoordinate {
+  const parts = coordinate.split(':');
+  const [groupId = '', artifactId = ''] = parts;
+  switch (parts.length) {
+    case 3:
+      return { groupId, artifactId, type: '', classifier: '', version: parts[2], scope: '' };
+    case 4:
+      return { groupId, artifactId, type: parts[2], classifier: '', version: parts[3], scope: '' };
+    case 5:
+      return { groupId, artifactId, type: parts[2], classifier: '', version: parts[3], scope: parts[4] };
+    case 6:
+      return { groupId, artifactId, type: parts[2], classifier: parts[3], version: parts[4], scope: parts[5] };
+    default:
+      return { groupId, artifactId, type: '', classifier: '', version: '', scope: '' };
+  }
+}
+
+/**
+ * 读取上传文件的文本内容。
+ *
+ * 字节只读取一次：先按 UTF-8 严格解码（TextDecoder 会去掉 BOM），
+ * 失败时在内存中改用备用编码解码（中文 Windows 下保存的文件常为 GBK），
+ * 不会为尝试不同编码重复读取文件。
+ */
+export async function readFileText(file: Blob, fallbackEncoding = 'gbk'): Promise<string> {
+  const bytes = await file.arrayBuffer();
+  try {
+    return new TextDecoder('utf-8', { fatal: true }).decode(bytes);
+  } catch {
+    return new TextDecoder(fallbackEncoding).decode(bytes);
+  }
+}
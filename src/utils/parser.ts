@@ -1 +1,234 @@
 // parser.ts - JSON 和 TXT 解析器
+import type { AnalysisReport, DependencyNode, RawDependencyNode } from '../types';
+
+// 粘连（y）模式的正则只在 lastIndex 处尝试匹配，可直接在原文的行首偏移上执行，
+// 无需为每一行截取子串，也不会向后回溯搜索
+// 默认以 [WARNING] 输出，-DfailOnWarning 时以 [ERROR] 输出
+const SECTION_HEADER = /\[(?:WARNING|ERROR)\][ \t]+(Used undeclared|Unused declared) dependencies found:/y;
+// [INFO] --------------------------< groupId:artifactId >--------------------------
+const PROJECT_HEADER = /\[INFO\][ \t]+-+< ([^\s>]+) >-+/y;
+// [WARNING]    groupId:artifactId:type:version:scope
+const DEPENDENCY_LINE = /\[(?:WARNING|ERROR)\][ \t]+([^\s:]+(?::[^\s:]+){2,5})[ \t\r]*$/my;
+// -Dverbose 时每个依赖下列出用到的类：[WARNING]       class com.example.Foo
+const CLASS_LINE = /\[(?:WARNING|ERROR)\][ \t]+class[ \t]/y;
+// 项目标题与分区标题的特征片段，用于在分区之外直接搜索到下一个候选标题行
+const NEXT_HEADER = /-< | dependencies found:/g;
+
+/**
+ * 解析 tree-mojo 格式的依赖树 JSON。
+ *
+ * 直接调用原生 JSON.parse 且不传 reviver：reviver 会对每个键值对回调一次，
+ * 大型依赖树上代价明显。解析完成后再一次性规范化为 DependencyNode。
+ */
+export function parseDependencyTree(content: string): DependencyNode {
+  let data: unknown;
+  try {
+    data = JSON.parse(content);
+  } catch (error) {
+    throw new Error(`依赖树 JSON 格式错误: ${(error as Error).message}`);
+  }
+
+  if (!isRawDependencyNode(data)) {
+    throw new Error('依赖树 JSON 缺少根节点的 groupId 或 artifactId');
+  }
+  return toDependencyTree(data);
+}
+
+function isRawDependencyNode(value: unknown): value is RawDependencyNode {
+  if (typeof value !== 'object' || value === null) {
+    return false;
+  }
+  const node = value as RawDependencyNode;
+  return typeof node.groupId === 'string' && typeof node.artifactId === 'string';
+}
+
+/** 用显式栈把原始 JSON 树转换为 DependencyNode 树，深层依赖树不会受调用栈深度限制 */
+function toDependencyTree(raw: RawDependencyNode): DependencyNode {
+  const root = createDependencyNode(raw);
+  const stack: [RawDependencyNode, DependencyNode][] = [[raw, root]];
+
+  while (stack.length > 0) {
+    const [rawNode, node] = stack.pop()!;
+    const rawChildren = rawNode.children;
+    if (rawChildren === undefined || rawChildren === null) {
+      continue;
+    }
+    // 子节点在入栈前逐个校验，坏数据统一报解析错误，而不是在取属性时抛出 TypeError
+    if (!Array.isArray(rawChildren)) {
+      throw new Error(`依赖树 JSON 中 ${node.id} 的 children 不是数组`);
+    }
+    if (rawChildren.length === 0) {
+      continue;
+    }
+    if (!rawChildren.every(isRawDependencyNode)) {
+      throw new Error(`依赖树 JSON 中 ${node.id} 的子节点缺少 groupId 或 artifactId`);
+    }
+    // 一次性生成子节点数组，避免逐个 push 时数组反复扩容
+    const children = rawChildren.map(createDependencyNode);
+    node.children = children;
+    for (let i = 0; i < children.length; i++) {
+      stack.push([rawChildren[i], children[i]]);
+    }
+  }
+  return root;
+}
+
+function createDependencyNode(raw: RawDependencyNode): DependencyNode {
+  const groupId = raw.groupId ?? '';
+  const artifactId = raw.artifactId ?? '';
+  return {
+    id: `${groupId}:${artifactId}`,
+    groupId,
+    artifactId,
+    version: raw.version ?? '',
+    type: raw.type ?? 'jar',
+    scope: raw.scope ?? '',
+    classifier: raw.classifier ?? '',
+    optional: raw.optional === true || raw.optional === 'true',
+    children: [],
+    // UI/分析状态字段也在创建时声明：所有节点保持同一对象形状，
+    // 之后写入状态不会让引擎为部分节点切换隐藏类
+    expanded: undefined,
+    selected: undefined,
+    usageStatus: undefined,
+    isRedundant: undefined,
+  };
+}
+
+/**
+ * 解析 mvn dependency:analyze 的文本输出。
+ *
+ * 按换行符位置逐行扫描，不用 split 生成整份构建日志的行数组，
+ * 模块级的粘连正则直接在行首偏移处匹配；遇到既不是依赖坐标、也不是 -Dverbose
+ * 类名的行即结束当前分区。
+ * 分区按所在模块（项目标题中的 groupId:artifactId）分别收集：依赖树 JSON 只描述一个模块，
+ * 顶层列表取日志中首个模块；日志含多个模块时，各模块的结果放在 modules 中供调用方按坐标选取。
+ * 分区之外的日志直接搜索下一个标题行跳过，不再逐行匹配。
+ */
+export function parseAnalysisReport(content: string): AnalysisReport {
+  const scanner = createAnalysisScanner();
+  scanner.write(content);
+  return scanner.finish();
+}
+
+/**
+ * 以流的方式解析 dependency:analyze 输出（如 File.stream()）。
+ * 按块解码并逐行扫描，内存中只保留当前块和未结束的一行，不会读入整份构建日志。
+ * fatal 为 true 时遇到非法字节会以 TypeError 拒绝，调用方可据此换用其他编码重试。
+ */
+export async function parseAnalysisReportStream(
+  stream: ReadableStream<Uint8Array>,
+  encoding = 'utf-8',
+  fatal = false,
+): Promise<AnalysisReport> {
+  const scanner = createAnalysisScanner();
+  const reader = stream.pipeThrough(new TextDecoderStream(encoding, { fatal })).getReader();
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) {
+      return scanner.finish();
+    }
+    scanner.write(value);
+  }
+}
+
+/** 增量扫描器：write 可多次调用，跨块的不完整行留到下一块拼接 */
+function createAnalysisScanner() {
+  // 同一模块可能输出多次（如配置了多个 execution），用 Set 按插入顺序去重
+  interface ModuleSections {
+    usedUndeclaredDeps: Set<string>;
+    unusedDeclaredDeps: Set<string>;
+  }
+  const createSections = (): ModuleSections => ({ usedUndeclaredDeps: new Set(), unusedDeclaredDeps: new Set() });
+  const modules = new Map<string, ModuleSections>();
+  // 日志中没有项目标题时（如只截取了警告部分），分区归入此处
+  const unnamed = createSections();
+  let current = unnamed;
+  let projectCoordinate: string | undefined;
+  let section: Set<string> | null = null;
+  let pending = '';
+
+  const scanLine = (content: string, start: number): void => {
+    PROJECT_HEADER.lastIndex = start;
+    const project = PROJECT_HEADER.exec(content);
+    if (project) {
+      const coordinate = project[1];
+      projectCoordinate ??= coordinate;
+      let sections = modules.get(coordinate);
+      if (sections === undefined) {
+        sections = createSections();
+        modules.set(coordinate, sections);
+      }
+      current = sections;
+      section = null;
+      return;
+    }
+
+    SECTION_HEADER.lastIndex = start;
+    const header = SECTION_HEADER.exec(content);
+    if (header) {
+      section = header[1] === 'Used undeclared' ? current.usedUndeclaredDeps : current.unusedDeclaredDeps;
+    } else if (section !== null) {
+      DEPENDENCY_LINE.lastIndex = start;
+      const match = DEPENDENCY_LINE.exec(content);
+      if (match) {
+        section.add(match[1]);
+      } else {
+        CLASS_LINE.lastIndex = start;
+        if (!CLASS_LINE.test(content)) {
+          section = null;
+        }
+      }
+    }
+  };
+
+  const toReport = (coordinate: string | undefined, sections: ModuleSections): AnalysisReport => ({
+    projectCoordinate: coordinate,
+    usedUndeclaredDeps: [...sections.usedUndeclaredDeps],
+    unusedDeclaredDeps: [...sections.unusedDeclaredDeps],
+  });
+
+  return {
+    write(chunk: string): void {
+      const content = pending + chunk;
+      let start = 0;
+      let end = content.indexOf('\n');
+      while (end >= 0) {
+        scanLine(content, start);
+        start = end + 1;
+        // 不在分区内时，只有标题行可能命中，直接跳到下一个候选标题所在行
+        if (section === null) {
+          NEXT_HEADER.lastIndex = start;
+          const next = NEXT_HEADER.exec(content);
+          if (next === null) {
+            // 只保留最后一个未结束的行，标题可能跨块
+            start = content.lastIndexOf('\n') + 1;
+            break;
+          }
+          start = content.lastIndexOf('\n', next.index) + 1;
+        }
+        end = content.indexOf('\n', start);
+      }
+      pending = content.slice(start);
+    },
+
+    finish(): AnalysisReport {
+      if (pending !== '') {
+        scanLine(pending, 0);
+        pending = '';
+      }
+      if (projectCoordinate === undefined) {
+        return toReport(undefined, unnamed);
+      }
+      const report = toReport(projectCoordinate, modules.get(projectCoordinate)!);
+      if (modules.size === 1) {
+        return report;
+      }
+      report.modules = {};
+      for (const [coordinate, sections] of modules) {
+        report.modules[coordinate] = toReport(coordinate, sections);
+      }
+      return report;
+    },
+  };
+}